@@ -1,20 +1,43 @@
 #!/usr/bin/env python3
 """Shared CuOracle commit-reveal client for ByteStrike Sepolia price bots."""
 
+import inspect
+import json
 import os
-import secrets
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from decimal import Decimal, ROUND_DOWN
-from typing import Iterable, List, Optional, Tuple
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
 
-from eth_account import Account
-from web3 import Web3
+from eth_hash.auto import keccak
+
+try:
+    import orjson
+except ImportError:  # optional; the update logs fall back to the stdlib encoder
+    orjson = None
+
+# web3, eth_account and requests are imported where they are used: together they
+# take most of a second to import, and dry runs, --help and skipped pushes never
+# touch the chain.
 
 
 SEPOLIA_CHAIN_ID = 11155111
 DEFAULT_CU_ORACLE_ADDRESS = "0x97f557594bA32e51c0eA215B1886111F24E957af"
+# Multicall3 is deployed at the same address on Sepolia and most EVM chains.
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
 PRICE_DECIMALS = 18
+_PRICE_SCALE = 10**PRICE_DECIMALS
+_PRICE_SCALE_DECIMAL = Decimal(_PRICE_SCALE)
+SEPOLIA_SLOT_SECONDS = 12
+ONE_GWEI = 10**9
+ONE_ETHER = 10**18
+# Near-empty Sepolia blocks report zero tips; builders with a minimum tip skip 0-tip txs.
+MIN_PRIORITY_FEE_WEI = int(Decimal("0.05") * ONE_GWEI)
+UPDATE_LOG_MAX_ENTRIES = 100
 
 INDEX_ASSET_IDS = {
     "H100_HOURLY": {
@@ -128,6 +151,28 @@ CU_ORACLE_ABI = [
 ]
 
 
+# commitPrice/updatePrices take only static 32-byte arguments, so their calldata
+# is the selector followed by the arguments' words.
+_COMMIT_PRICE_SELECTOR = keccak(b"commitPrice(bytes32,bytes32)")[:4]
+_UPDATE_PRICES_SELECTOR = keccak(b"updatePrices(bytes32,uint256,bytes32)")[:4]
+_OWNER_SELECTOR = keccak(b"owner()")[:4]
+_ALLOWED_ROLES_SELECTOR = keccak(b"allowedRoles(address)")[:4]
+_GET_LATEST_PRICE_SELECTOR = keccak(b"getLatestPrice(bytes32)")[:4]
+_SUPPORTED_ASSETS_SELECTOR = keccak(b"supportedAssets(bytes32)")[:4]
+_MIN_COMMIT_REVEAL_DELAY_SELECTOR = keccak(b"minCommitRevealDelay()")[:4]
+_AGGREGATE3_SELECTOR = keccak(b"aggregate3((address,bool,bytes)[])")[:4]
+_GET_CURRENT_BLOCK_TIMESTAMP_SELECTOR = keccak(b"getCurrentBlockTimestamp()")[:4]
+_PRICE_UPDATED_TOPIC = keccak(b"PriceUpdated(bytes32,uint256,uint256)")
+
+
+class OracleNotDeployedError(Exception):
+    """The configured CuOracle address has no contract code on the connected chain."""
+
+
+class OracleRoleError(Exception):
+    """The updater key lacks the CuOracle commit or reveal permission."""
+
+
 @dataclass
 class OraclePriceUpdate:
     asset_name: str
@@ -144,12 +189,35 @@ class OraclePriceUpdate:
         return f"${self.price_usd:.6f}/hr"
 
 
+@lru_cache(maxsize=None)
+def _asset_id_bytes(asset_id: str) -> bytes:
+    return bytes.fromhex(asset_id[2:])
+
+
+def _as_bytes(value) -> bytes:
+    """Log fields arrive as HexBytes from web3 or 0x-hex strings from raw RPC."""
+    return bytes.fromhex(value[2:]) if isinstance(value, str) else bytes(value)
+
+
+@lru_cache(maxsize=None)
+def _asset_call_data(selector: bytes, asset_id: str) -> str:
+    """Hex calldata for a view function taking a single bytes32 asset id."""
+    return "0x" + (selector + _asset_id_bytes(asset_id)).hex()
+
+
+@lru_cache(maxsize=None)
+def _checksum_address(address: str) -> str:
+    from web3 import Web3
+
+    return Web3.to_checksum_address(address)
+
+
 def price_to_x18(price_usd: float) -> int:
-    scaled = (Decimal(str(price_usd)) * (Decimal(10) ** PRICE_DECIMALS)).quantize(
-        Decimal("1"),
-        rounding=ROUND_DOWN,
-    )
-    return int(scaled)
+    return int((Decimal(str(price_usd)) * _PRICE_SCALE_DECIMAL).to_integral_value(rounding=ROUND_DOWN))
+
+
+def x18_to_price(price_scaled: int) -> float:
+    return price_scaled / _PRICE_SCALE
 
 
 def asset_update(asset_name: str, asset_config: dict, price_usd: float) -> OraclePriceUpdate:
@@ -162,89 +230,514 @@ def asset_update(asset_name: str, asset_config: dict, price_usd: float) -> Oracl
     )
 
 
+def load_env_file(script_file: str) -> None:
+    """Load the nearest .env, importing python-dotenv only when one exists.
+
+    Looks in the script's directory and its parents first (load_dotenv()'s default
+    lookup), then in the working directory and its parents.
+    """
+    for start in (Path(script_file).resolve().parent, Path.cwd()):
+        for directory in (start, *start.parents):
+            env_file = directory / ".env"
+            if env_file.is_file():
+                from dotenv import load_dotenv
+
+                load_dotenv(env_file)
+                return
+
+
+def force_updates_enabled() -> bool:
+    return os.getenv("ORACLE_FORCE_UPDATE", "").lower() in {"1", "true", "yes"}
+
+
+def bot_mode_enabled() -> bool:
+    """BOT_MODE marks unattended runs (CI), which get compact output."""
+    return os.getenv("BOT_MODE", "").lower() in {"1", "true", "yes"}
+
+
+def refresh_threshold_from_env() -> int:
+    try:
+        return int(os.getenv("ORACLE_REFRESH_THRESHOLD_SECONDS", str(6 * 60 * 60)))
+    except ValueError:
+        return 6 * 60 * 60
+
+
+def _json_line(entry: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(entry) + b"\n"
+    return json.dumps(entry).encode("utf-8") + b"\n"
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def iter_update_log(log_file: str) -> Iterator[dict]:
+    """Yield update log entries oldest first, skipping lines that do not parse."""
+    try:
+        handle = open(log_file, "rb")
+    except FileNotFoundError:
+        return
+    with handle:
+        for line in handle:
+            try:
+                yield _json_loads(line)
+            except ValueError:
+                continue
+
+
+def read_last_update_log(log_file: str) -> Optional[dict]:
+    """Newest entry that parses, so a torn final line does not hide the previous push."""
+    try:
+        last = deque(iter_update_log(log_file), maxlen=1)
+    except OSError:
+        return None
+    return last[0] if last else None
+
+
+def append_update_log(log_file: str, entry: dict, max_entries: int = UPDATE_LOG_MAX_ENTRIES) -> None:
+    """Append one JSON line to an update log, keeping between max_entries and 2 * max_entries entries.
+
+    Once the file holds roughly twice max_entries lines (estimated from this entry's
+    size, so most appends skip the read), it is trimmed back to the last max_entries.
+    """
+    line = _json_line(entry)
+    with open(log_file, "ab") as handle:
+        handle.write(line)
+        size = handle.tell()
+    if size <= 2 * max_entries * len(line):
+        return
+
+    with open(log_file, "rb") as handle:
+        recent = deque(handle, maxlen=max_entries)
+    compacted = f"{log_file}.tmp"
+    with open(compacted, "wb") as handle:
+        handle.writelines(recent)
+    os.replace(compacted, log_file)
+
+
 class CuOraclePriceUpdater:
     """Commits and reveals prices to ByteStrike CuOracle."""
 
     def __init__(self, rpc_url: str, private_key: str, oracle_address: Optional[str] = None):
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
-        if not self.w3.is_connected():
-            fallback_rpc_url = os.getenv("SEPOLIA_FALLBACK_RPC_URL", "https://ethereum-sepolia-rpc.publicnode.com")
-            if fallback_rpc_url and fallback_rpc_url != rpc_url:
-                print(f"Primary Sepolia RPC failed: {rpc_url}")
-                print(f"Trying fallback Sepolia RPC: {fallback_rpc_url}")
-                self.w3 = Web3(Web3.HTTPProvider(fallback_rpc_url))
-        if not self.w3.is_connected():
-            raise ConnectionError(f"Failed to connect to Sepolia RPC: {rpc_url}")
+        from eth_account import Account
 
         self.account = Account.from_key(private_key)
         self.address = self.account.address
-        self.oracle_address = Web3.to_checksum_address(oracle_address or DEFAULT_CU_ORACLE_ADDRESS)
-        self.contract = self.w3.eth.contract(address=self.oracle_address, abi=CU_ORACLE_ABI)
+        self.oracle_address = _checksum_address(oracle_address or DEFAULT_CU_ORACLE_ADDRESS)
         self._next_nonce: Optional[int] = None
-
-        balance_eth = self.w3.from_wei(self.w3.eth.get_balance(self.address), "ether")
-        owner = self.contract.functions.owner().call()
-        can_commit = self.address.lower() == owner.lower() or self.contract.functions.allowedRoles(self.address).call()
+        self._fee_cache: Optional[Tuple[float, dict]] = None
+        self._price_cache: Dict[str, Tuple[float, Tuple[int, int]]] = {}
+        # Assets never leave supportedAssets, so a positive check holds for the process lifetime.
+        self._supported_assets: Set[str] = set()
+
+        # Endpoints are tried in order: the given URL, any extra SEPOLIA_RPC_URLS, then
+        # SEPOLIA_FALLBACK_RPC_URL. Failover rotates through them, so a long-lived updater
+        # comes back around to the preferred endpoint instead of running out.
+        candidates = [rpc_url] + os.getenv("SEPOLIA_RPC_URLS", "").split(",")
+        candidates.append(os.getenv("SEPOLIA_FALLBACK_RPC_URL", "https://ethereum-sepolia-rpc.publicnode.com"))
+        self._standby_rpc_urls = deque(dict.fromkeys(url.strip() for url in candidates if url.strip()))
+
+        # Every startup read goes out in one JSON-RPC batch. Transport failures already fail
+        # over inside _rpc; this loop only moves on from endpoints that answer wrongly
+        # (another chain, rejected calls), trying each one at most once.
+        self._connect(self._standby_rpc_urls.popleft())
+        for attempt in range(len(self._standby_rpc_urls) + 1):
+            try:
+                status = self._startup_status()
+                break
+            except OSError as exc:
+                raise ConnectionError(f"Failed to connect to any Sepolia RPC (last: {self.rpc_url})") from exc
+            except (RuntimeError, ValueError) as exc:
+                failed_rpc_url = self.rpc_url
+                if attempt == len(self._standby_rpc_urls) or not self._fail_over():
+                    raise ConnectionError(f"Failed to connect to Sepolia RPC: {failed_rpc_url}") from exc
+        chain_id, block_number, balance_wei, owner, allowed = status
+        self.chain_id = chain_id
+        self._tx_template = {"chainId": chain_id, "to": self.oracle_address, "value": 0}
+
+        can_commit = self.address.lower() == owner.lower() or allowed
         can_reveal = self.address.lower() == owner.lower()
 
-        print("=" * 60)
-        print("BYTESTRIKE CUORACLE PRICE UPDATER")
-        print("=" * 60)
-        print(f"Chain ID: {self.w3.eth.chain_id}")
-        print(f"Latest block: {self.w3.eth.block_number}")
-        print(f"Updater address: {self.address}")
-        print(f"Balance: {balance_eth:.6f} ETH")
-        print(f"CuOracle: {self.oracle_address}")
-        print(f"Oracle owner: {owner}")
-        print(f"Can commit: {can_commit}")
-        print(f"Can reveal: {can_reveal}")
-        print("=" * 60)
+        if bot_mode_enabled():
+            print(
+                f"CuOracle updater {self.address}: chain {chain_id}, block {block_number}, "
+                f"balance {balance_wei / ONE_ETHER:.6f} ETH, oracle {self.oracle_address}, "
+                f"commit={can_commit}, reveal={can_reveal}"
+            )
+        else:
+            print("=" * 60)
+            print("BYTESTRIKE CUORACLE PRICE UPDATER")
+            print("=" * 60)
+            print(f"Chain ID: {chain_id}")
+            print(f"Latest block: {block_number}")
+            print(f"Updater address: {self.address}")
+            print(f"Balance: {balance_wei / ONE_ETHER:.6f} ETH")
+            print(f"CuOracle: {self.oracle_address}")
+            print(f"Oracle owner: {owner}")
+            print(f"Can commit: {can_commit}")
+            print(f"Can reveal: {can_reveal}")
+            print("=" * 60)
 
         if not can_commit:
-            raise PermissionError("Updater is not oracle owner and does not have allowedRoles commit permission")
+            raise OracleRoleError("Updater is not oracle owner and does not have allowedRoles commit permission")
         if not can_reveal:
-            raise PermissionError("CuOracle.updatePrices is owner-only; ORACLE_UPDATER_PRIVATE_KEY must be owner key")
-
-    def _fee_fields(self) -> dict:
-        priority_gwei = Decimal(os.getenv("ORACLE_MAX_PRIORITY_FEE_GWEI", "0.05"))
-        priority_fee = int(priority_gwei * Decimal(10**9))
-        latest_block = self.w3.eth.get_block("latest")
-        base_fee = latest_block.get("baseFeePerGas")
-        if base_fee is None:
-            return {"gasPrice": self.w3.eth.gas_price}
-        max_fee = max(int(base_fee) * 2 + priority_fee, priority_fee * 2)
+            raise OracleRoleError("CuOracle.updatePrices is owner-only; ORACLE_UPDATER_PRIVATE_KEY must be owner key")
+
+    def _connect(self, rpc_url: str) -> None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from web3 import Web3
+
+        # One keep-alive session serves both web3's provider and the raw batch posts,
+        # so the TLS handshake is paid once per run. Retries are left to _with_retries.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        provider_kwargs = {"session": self._session, "request_kwargs": {"timeout": 30}}
+        if "exception_retry_configuration" in inspect.signature(Web3.HTTPProvider.__init__).parameters:
+            provider_kwargs["exception_retry_configuration"] = None  # web3 >= 7
+        provider = Web3.HTTPProvider(rpc_url, **provider_kwargs)
+        if "exception_retry_configuration" not in provider_kwargs:
+            # web3 6.x retries through a provider middleware instead.
+            provider.middlewares = ()
+        self.w3 = Web3(provider)
+        self.rpc_url = rpc_url
+
+    def _fail_over(self) -> bool:
+        """Rotate to the next endpoint, queueing the failed one at the back; False with no alternative."""
+        if not self._standby_rpc_urls:
+            return False
+        next_rpc_url = self._standby_rpc_urls.popleft()
+        self._standby_rpc_urls.append(self.rpc_url)
+        print(f"Sepolia RPC failed: {self.rpc_url}")
+        print(f"Trying fallback Sepolia RPC: {next_rpc_url}")
+        self._connect(next_rpc_url)
+        return True
+
+    def _startup_status(self) -> Tuple[int, int, int, str, bool]:
+        """Chain id, block number, balance, oracle owner and commit role in one round-trip.
+
+        The pending nonce rides along in the same batch and seeds local nonce tracking.
+        """
+        address_word = bytes(12) + bytes.fromhex(self.address[2:])
+        call = {"to": self.oracle_address}
+        chain_id, block_number, balance, owner_word, allowed_word, nonce = self._rpc_batch([
+            ("eth_chainId", []),
+            ("eth_blockNumber", []),
+            ("eth_getBalance", [self.address, "latest"]),
+            ("eth_call", [{**call, "data": "0x" + _OWNER_SELECTOR.hex()}, "latest"]),
+            ("eth_call", [{**call, "data": "0x" + (_ALLOWED_ROLES_SELECTOR + address_word).hex()}, "latest"]),
+            ("eth_getTransactionCount", [self.address, "pending"]),
+        ])
+        if int(chain_id, 16) != SEPOLIA_CHAIN_ID:
+            raise RuntimeError(f"{self.rpc_url} is on chain {int(chain_id, 16)}, expected Sepolia ({SEPOLIA_CHAIN_ID})")
+        if owner_word == "0x" or allowed_word == "0x":
+            # An empty eth_call result means no code at the address, not a bad endpoint.
+            raise OracleNotDeployedError(f"No CuOracle contract at {self.oracle_address} on Sepolia")
+        owner = _checksum_address("0x" + owner_word[-40:])
+        self._next_nonce = int(nonce, 16)
+        return int(chain_id, 16), int(block_number, 16), int(balance, 16), owner, int(allowed_word, 16) != 0
+
+    def _with_retries(self, fn: Callable, *args, deadline: Optional[float] = None):
+        """Call fn, retrying transient network errors with exponential backoff.
+
+        Gives up after ORACLE_RPC_RETRIES attempts, or once time.monotonic() passes
+        deadline when one is given.
+        """
+        import requests
+
+        attempts = max(1, int(os.getenv("ORACLE_RPC_RETRIES", "4")))
+        attempt = 0
+        while True:
+            try:
+                return fn(*args)
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as exc:
+                status = getattr(getattr(exc, "response", None), "status_code", None)
+                if status is not None and status < 500 and status != 429:
+                    raise
+                attempt += 1
+                backoff = min(0.5 * 2 ** (attempt - 1), 8.0)
+                if deadline is None:
+                    if attempt >= attempts:
+                        raise
+                elif time.monotonic() + backoff > deadline:
+                    raise
+                print(f"  RPC error ({exc.__class__.__name__}), retrying in {backoff:.1f}s...")
+                time.sleep(backoff)
+
+    def _rpc(self, method: str, params: list, deadline: Optional[float] = None):
+        """Raw JSON-RPC call through the provider, skipping web3's middleware and formatters."""
+        # The one place transport failures fail over: each endpoint gets one retry budget.
+        endpoints = len(self._standby_rpc_urls) + 1
+        for attempt in range(endpoints):
+            try:
+                response = self._with_retries(self.w3.provider.make_request, method, params, deadline=deadline)
+                break
+            except OSError:
+                if attempt == endpoints - 1 or not self._fail_over():
+                    raise
+        if response.get("error"):
+            raise RuntimeError(f"{method} failed: {response['error']}")
+        return response["result"]
+
+    def _rpc_batch(self, calls: List[Tuple[str, list]]) -> list:
+        """Send several JSON-RPC calls in one HTTP round-trip.
+
+        Falls back to one request per call when the endpoint rejects batches.
+        """
+        import requests
+
+        payload = [
+            {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+            for request_id, (method, params) in enumerate(calls)
+        ]
+        try:
+            response = self._session.post(self.rpc_url, json=payload, timeout=30)
+            response.raise_for_status()
+            replies = response.json()
+            if not isinstance(replies, list):
+                raise ValueError(f"batch request rejected: {replies}")
+        except (requests.RequestException, ValueError):
+            return [self._rpc(method, params) for method, params in calls]
+
+        by_id = {reply.get("id"): reply for reply in replies}
+        results = []
+        for request_id, (method, params) in enumerate(calls):
+            reply = by_id.get(request_id)
+            if reply is None:
+                results.append(self._rpc(method, params))
+            elif reply.get("error"):
+                raise RuntimeError(f"{method} failed: {reply['error']}")
+            else:
+                results.append(reply["result"])
+        return results
+
+    def _fee_fields(self, fee_history: dict) -> dict:
+        """EIP-1559 fees from eth_feeHistory: next block's base fee and the median recent tip.
+
+        The network median is floored at MIN_PRIORITY_FEE_WEI (0.05 gwei);
+        ORACLE_MAX_PRIORITY_FEE_GWEI pins the tip instead of following the network.
+        """
+        base_fees = fee_history.get("baseFeePerGas") or []
+        if not base_fees or int(base_fees[-1], 16) == 0:
+            return {"gasPrice": int(self._rpc("eth_gasPrice", []), 16)}
+        priority_gwei = os.getenv("ORACLE_MAX_PRIORITY_FEE_GWEI")
+        tips = sorted(int(reward[0], 16) for reward in fee_history.get("reward") or [] if reward)
+        if priority_gwei:
+            priority_fee = int(Decimal(priority_gwei) * ONE_GWEI)
+        elif tips:
+            priority_fee = max(tips[len(tips) // 2], MIN_PRIORITY_FEE_WEI)
+        else:
+            priority_fee = MIN_PRIORITY_FEE_WEI
+        # baseFeePerGas[-1] is the base fee of the block after "latest".
+        max_fee = max(int(base_fees[-1], 16) * 2 + priority_fee, priority_fee * 2)
         return {
             "maxFeePerGas": max_fee,
             "maxPriorityFeePerGas": priority_fee,
         }
 
-    def _send_transaction(self, func, gas_limit: int) -> Tuple[str, dict]:
+    def _cached_fee_fields(self) -> Optional[dict]:
+        """Fee fields fetched within the last slot; the base fee cannot move much sooner."""
+        if self._fee_cache is None:
+            return None
+        fetched_at, fee_fields = self._fee_cache
+        max_age = float(os.getenv("ORACLE_FEE_CACHE_SECONDS", str(SEPOLIA_SLOT_SECONDS)))
+        if time.monotonic() - fetched_at >= max_age:
+            return None
+        return fee_fields
+
+    def _signing_inputs(self, count: int = 1) -> Tuple[int, dict]:
+        """Reserve count consecutive nonces and return (first nonce, fee fields).
+
+        Fee inputs and the starting nonce are fetched together; later nonces are
+        tracked locally since this updater is the only sender for its key.
+        """
+        fee_fields = self._cached_fee_fields()
+        calls = []
+        if fee_fields is None:
+            calls.append(("eth_feeHistory", [hex(5), "latest", [50]]))
         if self._next_nonce is None:
-            self._next_nonce = self.w3.eth.get_transaction_count(self.address, "pending")
-
-        tx = func.build_transaction(
-            {
-                "from": self.address,
-                "nonce": self._next_nonce,
-                "gas": gas_limit,
-                "chainId": SEPOLIA_CHAIN_ID,
-                **self._fee_fields(),
-            }
-        )
-        self._next_nonce += 1
+            calls.append(("eth_getTransactionCount", [self.address, "pending"]))
+        results = self._rpc_batch(calls) if calls else []
+        if fee_fields is None:
+            fee_fields = self._fee_fields(results.pop(0))
+            self._fee_cache = (time.monotonic(), fee_fields)
+        if self._next_nonce is None:
+            self._next_nonce = int(results.pop(0), 16)
+        nonce = self._next_nonce
+        self._next_nonce += count
+        return nonce, dict(fee_fields)
+
+    def _sign(self, data: bytes, gas_limit: int, nonce: int, fee_fields: dict) -> bytes:
+        """Sign an oracle call offline; no RPC and no updater state is touched."""
+        # Built by hand: build_transaction would re-run web3's formatting middleware
+        # for fields that are all already known here.
+        tx = {
+            **self._tx_template,
+            "data": data,
+            "nonce": nonce,
+            "gas": gas_limit,
+            **fee_fields,
+        }
         signed = self.account.sign_transaction(tx)
-        raw_tx = getattr(signed, "raw_transaction", getattr(signed, "rawTransaction", signed))
-        tx_hash = self.w3.eth.send_raw_transaction(raw_tx)
-        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=240)
-        if int(receipt.get("status", 0)) != 1:
-            raise RuntimeError(f"Transaction reverted: {tx_hash.hex()}")
-        return tx_hash.hex(), dict(receipt)
+        return getattr(signed, "raw_transaction", getattr(signed, "rawTransaction", signed))
 
-    def get_latest_price(self, asset_id: str, block_identifier="latest") -> Tuple[int, int]:
-        price, last_updated_at = self.contract.functions.getLatestPrice(asset_id).call(
-            block_identifier=block_identifier
+    def _sign_transaction(self, data: bytes, gas_limit: int) -> bytes:
+        nonce, fee_fields = self._signing_inputs()
+        return self._sign(data, gas_limit, nonce, fee_fields)
+
+    def _broadcast(self, raw_tx: bytes, deadline: Optional[float] = None) -> str:
+        raw_tx = bytes(raw_tx)
+        tx_hash = "0x" + keccak(raw_tx).hex()
+        try:
+            return self._rpc("eth_sendRawTransaction", ["0x" + raw_tx.hex()], deadline=deadline)
+        except RuntimeError as exc:
+            # A retried send may find that an earlier attempt already reached the node.
+            message = str(exc).lower()
+            if "already known" in message:
+                return tx_hash
+            if "nonce too low" in message and self._rpc("eth_getTransactionByHash", [tx_hash]) is not None:
+                return tx_hash
+            raise
+
+    def _submit_transaction(self, data: bytes, gas_limit: int) -> str:
+        try:
+            return self._broadcast(self._sign_transaction(data, gas_limit))
+        except RuntimeError as exc:
+            if "nonce too low" not in str(exc).lower():
+                raise
+            # Another transaction from this key landed; resync the nonce and re-sign once.
+            self._next_nonce = None
+            return self._broadcast(self._sign_transaction(data, gas_limit))
+
+    def _wait_for_receipt(self, tx_hash: str, timeout: float = 240) -> Tuple[str, Mapping]:
+        """Poll for a receipt, backing off to spare rate-limited RPCs.
+
+        Polling starts at ORACLE_RECEIPT_POLL_SECONDS (default 2) and grows 1.7x per
+        miss up to ORACLE_RECEIPT_POLL_MAX_SECONDS (default 8).
+        """
+        from web3.exceptions import TransactionNotFound
+
+        deadline = time.monotonic() + timeout
+        delay = float(os.getenv("ORACLE_RECEIPT_POLL_SECONDS", "2"))
+        max_delay = float(os.getenv("ORACLE_RECEIPT_POLL_MAX_SECONDS", "8"))
+        while True:
+            try:
+                receipt = self._with_retries(self.w3.eth.get_transaction_receipt, tx_hash)
+                break
+            except TransactionNotFound:
+                if time.monotonic() + delay > deadline:
+                    raise TimeoutError(f"Transaction {tx_hash} not mined after {timeout:.0f}s")
+                time.sleep(delay)
+                delay = min(delay * 1.7, max_delay)
+        if int(receipt.get("status", 0)) != 1:
+            raise RuntimeError(f"Transaction reverted: {tx_hash}")
+        return tx_hash, receipt
+
+    def _eth_call(self, data: str, block_identifier="latest") -> bytes:
+        """eth_call against the oracle with 0x-hex calldata; returns the raw result."""
+        if isinstance(block_identifier, int):
+            block_identifier = hex(block_identifier)
+        result = self._rpc("eth_call", [{"to": self.oracle_address, "data": data}, block_identifier])
+        return bytes.fromhex(result[2:])
+
+    def _multicall(self, calls: List[Tuple[str, str, bool]]) -> List[Optional[bytes]]:
+        """Run (target, hex calldata, allow_failure) view calls in one Multicall3 aggregate3 eth_call.
+
+        A reverted allow_failure call yields None; any other revert raises. Falls back to
+        a JSON-RPC batch of plain eth_calls if Multicall3 is unavailable.
+        """
+        from eth_abi import decode, encode
+        from eth_abi.exceptions import DecodingError
+
+        encoded = encode(
+            ["(address,bool,bytes)[]"],
+            [[(target, allow_failure, bytes.fromhex(data[2:])) for target, data, allow_failure in calls]],
         )
-        return int(price), int(last_updated_at)
+        aggregate = {"to": MULTICALL3_ADDRESS, "data": "0x" + (_AGGREGATE3_SELECTOR + encoded).hex()}
+        try:
+            result = self._rpc("eth_call", [aggregate, "latest"])
+            (replies,) = decode(["(bool,bytes)[]"], bytes.fromhex(result[2:]))
+            return [bytes(return_data) if success else None for success, return_data in replies]
+        except (RuntimeError, ValueError, DecodingError):
+            pass
+
+        eth_calls = [("eth_call", [{"to": target, "data": data}, "latest"]) for target, data, _allow_failure in calls]
+        try:
+            return [bytes.fromhex(result[2:]) for result in self._rpc_batch(eth_calls)]
+        except RuntimeError:
+            # Something reverted; redo the calls one by one so only disallowed reverts raise.
+            results: List[Optional[bytes]] = []
+            for (_target, _data, allow_failure), (method, params) in zip(calls, eth_calls):
+                try:
+                    results.append(bytes.fromhex(self._rpc(method, params)[2:]))
+                except RuntimeError:
+                    if not allow_failure:
+                        raise
+                    results.append(None)
+            return results
+
+    def _oracle_snapshot(
+        self, asset_ids: List[str], check_supported: Sequence[str] = ()
+    ) -> Tuple[int, Dict[str, Tuple[int, int]], Dict[str, bool]]:
+        """Read the block timestamp, each latest price and supportedAssets for check_supported in one multicall.
+
+        getLatestPrice may revert for unregistered assets, so those reads are allowed to
+        fail; such assets are left out of the returned prices.
+        """
+        block_timestamp_call = (MULTICALL3_ADDRESS, "0x" + _GET_CURRENT_BLOCK_TIMESTAMP_SELECTOR.hex(), False)
+        calls = [block_timestamp_call]
+        calls += [
+            (self.oracle_address, _asset_call_data(_GET_LATEST_PRICE_SELECTOR, asset_id), True) for asset_id in asset_ids
+        ]
+        calls += [
+            (self.oracle_address, _asset_call_data(_SUPPORTED_ASSETS_SELECTOR, asset_id), False)
+            for asset_id in check_supported
+        ]
+        results = self._multicall(calls)
+        fetched_at = time.monotonic()
+        block_timestamp_word = results[0]
+        if block_timestamp_word:
+            block_timestamp = int.from_bytes(block_timestamp_word[:32], "big")
+        else:
+            # The JSON-RPC batch fallback got no code back at the Multicall3 address.
+            block_timestamp = int(self._rpc("eth_getBlockByNumber", ["latest", False])["timestamp"], 16)
+        latest = {}
+        for asset_id, result in zip(asset_ids, results[1 : 1 + len(asset_ids)]):
+            if result is None:
+                continue
+            latest[asset_id] = int.from_bytes(result[:32], "big"), int.from_bytes(result[32:64], "big")
+            self._price_cache[asset_id] = (fetched_at, latest[asset_id])
+        supported = {asset_id: any(result) for asset_id, result in zip(check_supported, results[1 + len(asset_ids) :])}
+        return block_timestamp, latest, supported
+
+    def get_latest_prices(self, asset_ids: List[str]) -> Tuple[int, Dict[str, Tuple[int, int]]]:
+        """Read the latest block timestamp and each asset's (price, lastUpdatedAt) in one round-trip.
+
+        The prices also refresh the short-lived price cache. Assets whose read reverts are left out.
+        """
+        block_timestamp, latest, _ = self._oracle_snapshot(asset_ids)
+        return block_timestamp, latest
+
+    def get_latest_price(
+        self, asset_id: str, block_identifier="latest", max_age: Optional[float] = None
+    ) -> Tuple[int, int]:
+        """Read (price, lastUpdatedAt); "latest" reads are reused for up to max_age seconds.
+
+        max_age defaults to ORACLE_PRICE_CACHE_SECONDS; pass 0 to force a fresh read.
+        """
+        if block_identifier == "latest":
+            if max_age is None:
+                max_age = float(os.getenv("ORACLE_PRICE_CACHE_SECONDS", "5"))
+            cached = self._price_cache.get(asset_id)
+            if cached is not None and time.monotonic() - cached[0] < max_age:
+                return cached[1]
+        result = self._eth_call(_asset_call_data(_GET_LATEST_PRICE_SELECTOR, asset_id), block_identifier)
+        latest = int.from_bytes(result[:32], "big"), int.from_bytes(result[32:64], "big")
+        if block_identifier == "latest":
+            self._price_cache[asset_id] = (time.monotonic(), latest)
+        return latest
 
     def get_latest_price_usd(self, asset_id: str) -> Optional[float]:
         try:
@@ -253,36 +746,45 @@ class CuOraclePriceUpdater:
             return None
         if price == 0:
             return None
-        return price / 10**PRICE_DECIMALS
+        return x18_to_price(price)
 
     def _commit_hash(self, update: OraclePriceUpdate) -> bytes:
         assert update.nonce is not None
-        return Web3.solidity_keccak(["uint256", "bytes32"], [update.price_scaled, update.nonce])
-
-    def _prepare_update(self, update: OraclePriceUpdate) -> OraclePriceUpdate:
-        if update.price_scaled <= 0:
-            raise ValueError(f"{update.asset_name} price must be positive")
-        if not self.contract.functions.supportedAssets(update.asset_id).call():
-            raise ValueError(f"{update.asset_name} is not registered in CuOracle: {update.asset_id}")
-        update.nonce = Web3.keccak(
-            text=f"{update.asset_id}:{update.price_scaled}:{time.time_ns()}:{secrets.token_hex(16)}"
-        )
-        return update
+        # abi.encodePacked(uint256, bytes32) is just the two 32-byte words back to back.
+        return keccak(update.price_scaled.to_bytes(32, "big") + update.nonce)
 
-    def _filter_noop_updates(self, updates: List[OraclePriceUpdate]) -> List[OraclePriceUpdate]:
-        force_updates = os.getenv("ORACLE_FORCE_UPDATE", "").lower() in {"1", "true", "yes"}
+    def _prepare_updates(self, updates: List[OraclePriceUpdate]) -> int:
+        """Check registration and read current prices for every update in one multicall.
 
-        try:
-            refresh_threshold_seconds = int(os.getenv("ORACLE_REFRESH_THRESHOLD_SECONDS", str(6 * 60 * 60)))
-        except ValueError:
-            refresh_threshold_seconds = 6 * 60 * 60
+        Returns the block timestamp from the same read for the no-op filter.
+        """
+        for update in updates:
+            if update.price_scaled <= 0:
+                raise ValueError(f"{update.asset_name} price must be positive")
+        asset_ids = [update.asset_id for update in updates]
+        block_timestamp, latest, supported = self._oracle_snapshot(
+            asset_ids, check_supported=[asset_id for asset_id in asset_ids if asset_id not in self._supported_assets]
+        )
+        for update in updates:
+            if not supported.get(update.asset_id, True):
+                raise ValueError(f"{update.asset_name} is not registered in CuOracle: {update.asset_id}")
+            if update.asset_id not in latest:
+                raise RuntimeError(f"getLatestPrice reverted for {update.asset_name}: {update.asset_id}")
+            update.previous_price_scaled, update.previous_timestamp = latest[update.asset_id]
+            self._supported_assets.add(update.asset_id)
+            # os.urandom reads the kernel CSPRNG (getrandom(2)), the same source secrets wraps.
+            update.nonce = os.urandom(32)
+        return block_timestamp
+
+    def _filter_noop_updates(
+        self, updates: List[OraclePriceUpdate], latest_block_timestamp: int
+    ) -> List[OraclePriceUpdate]:
+        force_updates = force_updates_enabled()
+        refresh_threshold_seconds = refresh_threshold_from_env()
 
-        latest_block_timestamp = int(self.w3.eth.get_block("latest")["timestamp"])
         filtered: List[OraclePriceUpdate] = []
         for update in updates:
-            current_price, current_timestamp = self.get_latest_price(update.asset_id)
-            update.previous_price_scaled = current_price
-            update.previous_timestamp = current_timestamp
+            current_price, current_timestamp = update.previous_price_scaled, update.previous_timestamp
 
             if force_updates:
                 filtered.append(update)
@@ -305,7 +807,36 @@ class CuOraclePriceUpdater:
             filtered.append(update)
         return filtered
 
-    def _verify_revealed_price(self, update: OraclePriceUpdate, receipt: dict) -> Tuple[int, int]:
+    def _revealed_price_from_receipt(self, update: OraclePriceUpdate, receipt: Mapping) -> Optional[Tuple[int, int]]:
+        """(price, timestamp) from a PriceUpdated(bytes32,uint256,uint256) log for this asset, if any.
+
+        Indexing does not change the topic hash, so both plausible layouts are accepted:
+        price in data next to the timestamp, or price indexed with the timestamp as the only data word.
+        """
+        asset_id = _asset_id_bytes(update.asset_id)
+        for log in receipt.get("logs", []):
+            topics = [_as_bytes(topic) for topic in log["topics"]]
+            if (
+                len(topics) < 2
+                or topics[0] != _PRICE_UPDATED_TOPIC
+                or topics[1] != asset_id
+                or log["address"].lower() != self.oracle_address.lower()
+            ):
+                continue
+            data = _as_bytes(log["data"])
+            if len(topics) == 2 and len(data) == 64:
+                return int.from_bytes(data[:32], "big"), int.from_bytes(data[32:], "big")
+            if len(topics) == 3 and len(data) == 32:
+                return int.from_bytes(topics[2], "big"), int.from_bytes(data, "big")
+        return None
+
+    def _verify_revealed_price(self, update: OraclePriceUpdate, receipt: Mapping) -> Tuple[int, int]:
+        # Opportunistic: if the reveal receipt carries a matching PriceUpdated event, skip the
+        # read-back. The event layout is not pinned in this repo, so no match just means polling.
+        emitted = self._revealed_price_from_receipt(update, receipt)
+        if emitted is not None and emitted[0] == update.price_scaled:
+            return emitted
+
         attempts = int(os.getenv("ORACLE_VERIFY_ATTEMPTS", "12"))
         delay_seconds = float(os.getenv("ORACLE_VERIFY_RETRY_SECONDS", "2"))
         reveal_block = int(receipt["blockNumber"])
@@ -328,7 +859,7 @@ class CuOraclePriceUpdater:
                 ):
                     return latest, last_updated_at
 
-                latest, last_updated_at = self.get_latest_price(update.asset_id)
+                latest, last_updated_at = self.get_latest_price(update.asset_id, max_age=0)
                 latest_seen = latest
                 last_updated_seen = last_updated_at
                 if latest == update.price_scaled and (
@@ -352,23 +883,47 @@ class CuOraclePriceUpdater:
             detail += f", last error {last_error}"
         raise RuntimeError(f"Verification failed for {update.asset_name}: {detail}")
 
+    def _sign_reveals(self, updates: List[OraclePriceUpdate], first_nonce: int, fee_fields: dict) -> List[bytes]:
+        """Sign every reveal from inputs captured up front; safe to run off the main thread."""
+        return [
+            self._sign(
+                _UPDATE_PRICES_SELECTOR
+                + _asset_id_bytes(update.asset_id)
+                + update.price_scaled.to_bytes(32, "big")
+                + update.nonce,
+                120_000,
+                first_nonce + offset,
+                fee_fields,
+            )
+            for offset, update in enumerate(updates)
+        ]
+
     def commit_and_reveal(
         self,
         updates: Iterable[OraclePriceUpdate],
         verify: bool = True,
+        wait_for_reveals: bool = True,
     ) -> Tuple[List[str], List[str]]:
-        requested = [self._prepare_update(update) for update in updates]
+        """Commit then reveal every update that would change CuOracle.
+
+        Commits are always awaited, since reveals must land after them. With
+        wait_for_reveals=False the reveal hashes are returned as soon as they are
+        broadcast, skipping their receipts and verification.
+        """
+        requested = list(updates)
         if not requested:
             raise ValueError("No price updates provided")
+        latest_block_timestamp = self._prepare_updates(requested)
 
         print("\nPrepared CuOracle updates:")
-        prepared = self._filter_noop_updates(requested)
+        prepared = self._filter_noop_updates(requested, latest_block_timestamp)
         if not prepared:
             print("  All requested prices already match CuOracle. No transactions needed.")
             return [], []
 
         for update in prepared:
-            current = self.get_latest_price_usd(update.asset_id)
+            # The no-op filter already read each asset's on-chain price.
+            current = x18_to_price(update.previous_price_scaled) if update.previous_price_scaled else None
             if current:
                 change_pct = ((update.price_usd - current) / current) * 100
                 print(
@@ -378,30 +933,68 @@ class CuOraclePriceUpdater:
             else:
                 print(f"  {update.asset_name} ({update.market}): {update.price_formatted}")
 
+        # Each phase broadcasts every transaction back-to-back (nonces are tracked
+        # locally) and only then waits, so N assets confirm in ~one block, not N.
         commit_hashes: List[str] = []
         print("\nCommitting prices...")
-        for update in prepared:
-            commit = self._commit_hash(update)
-            tx_hash, receipt = self._send_transaction(
-                self.contract.functions.commitPrice(update.asset_id, commit),
-                gas_limit=100_000,
-            )
-            commit_hashes.append(tx_hash)
-            print(f"  commit {update.asset_name}: {tx_hash} (gas {receipt['gasUsed']:,})")
-
-        min_delay = int(self.contract.functions.minCommitRevealDelay().call())
+        try:
+            pending = [
+                self._submit_transaction(
+                    _COMMIT_PRICE_SELECTOR + _asset_id_bytes(update.asset_id) + self._commit_hash(update),
+                    gas_limit=100_000,
+                )
+                for update in prepared
+            ]
+            # Everything the reveals need from the node or from shared state is read here,
+            # so the worker below only signs and never touches w3, the session or the caches.
+            reveal_nonce, reveal_fees = self._signing_inputs(len(prepared))
+            min_delay = int.from_bytes(self._eth_call("0x" + _MIN_COMMIT_REVEAL_DELAY_SELECTOR.hex()), "big")
+        except Exception:
+            # A failed send leaves its nonce unused; resync so a long-lived updater recovers.
+            self._next_nonce = None
+            raise
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            reveal_prep = executor.submit(self._sign_reveals, prepared, reveal_nonce, reveal_fees)
+            try:
+                for update, submitted in zip(prepared, pending):
+                    tx_hash, receipt = self._wait_for_receipt(submitted)
+                    commit_hashes.append(tx_hash)
+                    print(f"  commit {update.asset_name}: {tx_hash} (gas {receipt['gasUsed']:,})")
+                commits_mined_at = time.monotonic()
+                signed_reveals = reveal_prep.result()
+            except Exception:
+                # Pre-signed reveals may have claimed nonces that will never be broadcast.
+                self._next_nonce = None
+                raise
+
+        # The delay counts from the last commit receipt, because later commits may land in
+        # later blocks. Only time spent after it (finishing the reveal signatures) is deducted.
         wait_seconds = max(int(os.getenv("ORACLE_REVEAL_WAIT_SECONDS", "3")), min_delay + 1)
-        print(f"\nWaiting {wait_seconds}s before reveal...")
-        time.sleep(wait_seconds)
+        remaining = wait_seconds - (time.monotonic() - commits_mined_at)
+        if remaining > 0:
+            print(f"\nWaiting {remaining:.1f}s before reveal...")
+            time.sleep(remaining)
 
         reveal_hashes: List[str] = []
-        reveal_receipts: List[dict] = []
+        reveal_receipts: List[Mapping] = []
         print("\nRevealing prices...")
-        for update in prepared:
-            tx_hash, receipt = self._send_transaction(
-                self.contract.functions.updatePrices(update.asset_id, update.price_scaled, update.nonce),
-                gas_limit=120_000,
-            )
+        # An orphaned commit costs more than a slow reveal, so keep retrying the
+        # broadcasts for up to ORACLE_REVEAL_RETRY_SECONDS.
+        reveal_deadline = time.monotonic() + float(os.getenv("ORACLE_REVEAL_RETRY_SECONDS", "120"))
+        self._price_cache.clear()
+        try:
+            pending = [self._broadcast(raw_tx, deadline=reveal_deadline) for raw_tx in signed_reveals]
+        except Exception:
+            self._next_nonce = None
+            raise
+        if not wait_for_reveals:
+            for update, tx_hash in zip(prepared, pending):
+                print(f"  reveal {update.asset_name}: {tx_hash} (sent, not awaited)")
+            print("\nSkipping reveal receipts and verification (--async-send)")
+            return commit_hashes, pending
+
+        for update, submitted in zip(prepared, pending):
+            tx_hash, receipt = self._wait_for_receipt(submitted)
             reveal_hashes.append(tx_hash)
             reveal_receipts.append(receipt)
             print(f"  reveal {update.asset_name}: {tx_hash} (gas {receipt['gasUsed']:,})")
@@ -2,31 +2,33 @@
 """Push AWS/Azure/GCP H100 provider prices to ByteStrike CuOracle."""
 
 import argparse
-import json
 import math
 import os
 import sys
 from datetime import datetime, timezone
 from typing import List
 
-from dotenv import load_dotenv
-
 from cu_oracle_client import (
     DEFAULT_CU_ORACLE_ADDRESS,
     H100_PROVIDER_ASSET_IDS,
     CuOraclePriceUpdater,
     OraclePriceUpdate,
+    append_update_log,
     asset_update,
+    load_env_file,
+    x18_to_price,
 )
 
-load_dotenv()
-
-SEPOLIA_RPC_URL = os.getenv("SEPOLIA_RPC_URL", "https://ethereum-sepolia-rpc.publicnode.com")
-PRIVATE_KEY = os.getenv("ORACLE_UPDATER_PRIVATE_KEY") or os.getenv("PRIVATE_KEY") or os.getenv("WALLET_PRIVATE_KEY")
-CU_ORACLE_ADDRESS = os.getenv("CU_ORACLE_ADDRESS", DEFAULT_CU_ORACLE_ADDRESS)
+DEFAULT_SEPOLIA_RPC_URL = "https://ethereum-sepolia-rpc.publicnode.com"
 
 
-def log_updates(updates: List[OraclePriceUpdate], commit_hashes, reveal_hashes, updater: CuOraclePriceUpdater) -> None:
+def log_updates(
+    updates: List[OraclePriceUpdate],
+    commit_hashes,
+    reveal_hashes,
+    updater: CuOraclePriceUpdater,
+    reveals_confirmed: bool = True,
+) -> None:
     log_entry = {
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "network": "sepolia",
@@ -35,6 +37,8 @@ def log_updates(updates: List[OraclePriceUpdate], commit_hashes, reveal_hashes,
         "updater_address": updater.address,
         "commit_txs": commit_hashes,
         "reveal_txs": reveal_hashes,
+        # False under --async-send: the reveals were broadcast but never seen mined.
+        "reveals_confirmed": reveals_confirmed,
         "updates": [
             {
                 "asset_name": update.asset_name,
@@ -47,20 +51,8 @@ def log_updates(updates: List[OraclePriceUpdate], commit_hashes, reveal_hashes,
         ],
     }
 
-    log_file = "h100_provider_price_log.json"
-    logs = []
-    if os.path.exists(log_file):
-        try:
-            with open(log_file, "r", encoding="utf-8") as handle:
-                loaded = json.load(handle)
-                logs = loaded if isinstance(loaded, list) else []
-        except Exception:
-            logs = []
-
-    logs.append(log_entry)
-    logs = logs[-100:]
-    with open(log_file, "w", encoding="utf-8") as handle:
-        json.dump(logs, handle, indent=2)
+    log_file = "h100_provider_price_log.jsonl"
+    append_update_log(log_file, log_entry)
     print(f"Logged update to {log_file}")
 
 
@@ -78,6 +70,12 @@ def maybe_add_update(updates: List[OraclePriceUpdate], arg_name: str, asset_name
 
 
 def main() -> None:
+    # python-dotenv is only imported when a .env is found (CI passes secrets as env vars).
+    load_env_file(__file__)
+    private_key = (
+        os.getenv("ORACLE_UPDATER_PRIVATE_KEY") or os.getenv("PRIVATE_KEY") or os.getenv("WALLET_PRIVATE_KEY")
+    )
+
     parser = argparse.ArgumentParser(
         description="Update AWS/Azure/GCP H100 prices on ByteStrike CuOracle",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -99,12 +97,19 @@ Examples:
     parser.add_argument("--show", action="store_true", help="Show current prices and exit")
     parser.add_argument("--dry-run", action="store_true", help="Print planned updates without sending transactions")
     parser.add_argument("--no-verify", action="store_true", help="Skip read-back verification")
+    parser.add_argument(
+        "--async-send",
+        action="store_true",
+        help="Return once reveals are broadcast instead of waiting for their receipts (implies --no-verify)",
+    )
     args = parser.parse_args()
+    # Nothing is left to verify against once we stop waiting for the reveal receipts.
+    args.no_verify = args.no_verify or args.async_send
 
     if args.batch:
         print("NOTE: --batch is accepted for compatibility; CuOracle has single-asset commit/reveal methods.")
 
-    if not PRIVATE_KEY and not args.dry_run:
+    if not private_key and not args.dry_run:
         print("ERROR: Private key not configured")
         print("Set ORACLE_UPDATER_PRIVATE_KEY, PRIVATE_KEY, or WALLET_PRIVATE_KEY. The key must own CuOracle.")
         sys.exit(1)
@@ -126,18 +131,23 @@ Examples:
 
     try:
         updater = CuOraclePriceUpdater(
-            rpc_url=SEPOLIA_RPC_URL,
-            private_key=PRIVATE_KEY,
-            oracle_address=CU_ORACLE_ADDRESS,
+            rpc_url=os.getenv("SEPOLIA_RPC_URL", DEFAULT_SEPOLIA_RPC_URL),
+            private_key=private_key,
+            oracle_address=os.getenv("CU_ORACLE_ADDRESS", DEFAULT_CU_ORACLE_ADDRESS),
         )
 
-        print("\nCurrent H100 provider prices:")
-        for name, config in H100_PROVIDER_ASSET_IDS.items():
-            current = updater.get_latest_price_usd(config["asset_id"])
-            if current is None:
-                print(f"  {name} ({config['market']}): no price set")
-            else:
-                print(f"  {name} ({config['market']}): ${current:.6f}/hr")
+        # Display only; commit_and_reveal reads the prices it needs itself, so --no-verify skips this.
+        if args.show or not args.no_verify:
+            print("\nCurrent H100 provider prices:")
+            _, current_prices = updater.get_latest_prices(
+                [config["asset_id"] for config in H100_PROVIDER_ASSET_IDS.values()]
+            )
+            for name, config in H100_PROVIDER_ASSET_IDS.items():
+                current, _ = current_prices.get(config["asset_id"], (0, 0))
+                if current == 0:
+                    print(f"  {name} ({config['market']}): no price set")
+                else:
+                    print(f"  {name} ({config['market']}): ${x18_to_price(current):.6f}/hr")
 
         if args.show:
             sys.exit(0)
@@ -147,9 +157,11 @@ Examples:
             print("Use --aws, --azure, and/or --gcp to specify prices.")
             sys.exit(1)
 
-        commit_hashes, reveal_hashes = updater.commit_and_reveal(updates, verify=not args.no_verify)
+        commit_hashes, reveal_hashes = updater.commit_and_reveal(
+            updates, verify=not args.no_verify, wait_for_reveals=not args.async_send
+        )
         if commit_hashes or reveal_hashes:
-            log_updates(updates, commit_hashes, reveal_hashes, updater)
+            log_updates(updates, commit_hashes, reveal_hashes, updater, reveals_confirmed=not args.async_send)
     except Exception as exc:
         print("\nERROR: CUORACLE UPDATE FAILED")
         print(f"  {exc}")
@@ -158,7 +170,10 @@ Examples:
         traceback.print_exc()
         sys.exit(1)
 
-    print("\nSUCCESS: H100 provider prices updated on ByteStrike CuOracle")
+    if reveal_hashes and args.async_send:
+        print("\nSENT: H100 provider price reveals broadcast to ByteStrike CuOracle (unconfirmed)")
+    else:
+        print("\nSUCCESS: H100 provider prices updated on ByteStrike CuOracle")
     if reveal_hashes:
         print("Reveal transactions:")
         for tx_hash in reveal_hashes:
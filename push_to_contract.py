@@ -3,33 +3,50 @@
 
 import argparse
 import csv
-import json
 import os
 import sys
+import time
+from collections import deque
 from datetime import datetime, timezone
 from typing import Dict, Optional
 
-from dotenv import load_dotenv
-
 from cu_oracle_client import (
     DEFAULT_CU_ORACLE_ADDRESS,
     INDEX_ASSET_IDS,
     CuOraclePriceUpdater,
+    OracleRoleError,
+    append_update_log,
     asset_update,
+    force_updates_enabled,
+    load_env_file,
+    price_to_x18,
+    read_last_update_log,
+    refresh_threshold_from_env,
 )
 
-load_dotenv()
+DEFAULT_SEPOLIA_RPC_URL = "https://ethereum-sepolia-rpc.publicnode.com"
+CSV_READ_BUFFER_BYTES = 1 << 20
+UPDATE_LOG_FILE = "contract_update_log.jsonl"
+
 
-SEPOLIA_RPC_URL = os.getenv("SEPOLIA_RPC_URL", "https://ethereum-sepolia-rpc.publicnode.com")
-PRIVATE_KEY = os.getenv("ORACLE_UPDATER_PRIVATE_KEY") or os.getenv("PRIVATE_KEY")
-CU_ORACLE_ADDRESS = os.getenv("CU_ORACLE_ADDRESS", DEFAULT_CU_ORACLE_ADDRESS)
+def read_last_csv_row(csv_file: str) -> Optional[Dict[str, str]]:
+    """Return the final data row of a CSV, keeping only one row in memory."""
+    # The whole file is streamed to find the last row, so read it in 1 MiB chunks.
+    with open(csv_file, "r", encoding="utf-8", newline="", buffering=CSV_READ_BUFFER_BYTES) as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        # csv.reader handles quoted multi-line fields; deque keeps just the last row.
+        tail = deque((row for row in reader if row), maxlen=1)
+
+    if header is None or not tail:
+        return None
+    return dict(zip(header, tail[0]))
 
 
 def read_prices_from_csv(csv_file: str) -> Optional[Dict[str, float]]:
     """Read H100 index prices from gpu_index_calculator.py output."""
     try:
-        with open(csv_file, "r", encoding="utf-8") as handle:
-            rows = list(csv.DictReader(handle))
+        latest = read_last_csv_row(csv_file)
     except FileNotFoundError:
         print(f"ERROR: CSV file not found: {csv_file}")
         return None
@@ -37,11 +54,10 @@ def read_prices_from_csv(csv_file: str) -> Optional[Dict[str, float]]:
         print(f"ERROR: Failed to read CSV {csv_file}: {exc}")
         return None
 
-    if not rows:
+    if latest is None:
         print(f"ERROR: CSV file is empty: {csv_file}")
         return None
 
-    latest = rows[-1]
     required_columns = ["Full_Index_Price", "Hyperscalers_Only_Price", "Non_Hyperscalers_Only_Price"]
     missing = [column for column in required_columns if column not in latest]
     if missing:
@@ -70,7 +86,14 @@ def read_prices_from_csv(csv_file: str) -> Optional[Dict[str, float]]:
     return prices
 
 
-def log_update(prices: Dict[str, float], commit_hashes, reveal_hashes, updater: CuOraclePriceUpdater) -> None:
+def log_update(
+    prices: Dict[str, float],
+    commit_hashes,
+    reveal_hashes,
+    updater: CuOraclePriceUpdater,
+    csv_mtime: Optional[float] = None,
+    reveals_confirmed: bool = True,
+) -> None:
     log_entry = {
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "network": "sepolia",
@@ -79,32 +102,42 @@ def log_update(prices: Dict[str, float], commit_hashes, reveal_hashes, updater:
         "updater_address": updater.address,
         "commit_txs": commit_hashes,
         "reveal_txs": reveal_hashes,
+        # False under --async-send: the reveals were broadcast but never seen mined.
+        "reveals_confirmed": reveals_confirmed,
         "prices": {
             name: {
                 "market": INDEX_ASSET_IDS[name]["market"],
                 "asset_symbol": INDEX_ASSET_IDS[name]["asset_symbol"],
                 "asset_id": INDEX_ASSET_IDS[name]["asset_id"],
                 "price_usd": price,
+                "price_scaled": price_to_x18(price),
             }
             for name, price in prices.items()
         },
+        "csv_mtime": csv_mtime,
     }
 
-    log_file = "contract_update_log.json"
-    logs = []
-    if os.path.exists(log_file):
-        try:
-            with open(log_file, "r", encoding="utf-8") as handle:
-                loaded = json.load(handle)
-                logs = loaded if isinstance(loaded, list) else []
-        except Exception:
-            logs = []
+    append_update_log(UPDATE_LOG_FILE, log_entry)
+    print(f"Logged update to {UPDATE_LOG_FILE}")
+
 
-    logs.append(log_entry)
-    logs = logs[-100:]
-    with open(log_file, "w", encoding="utf-8") as handle:
-        json.dump(logs, handle, indent=2)
-    print(f"Logged update to {log_file}")
+def unchanged_since_last_push(csv_mtime: float, prices: Dict[str, float]) -> bool:
+    """True when the last logged push came from this same CSV and is not yet due a refresh."""
+    last = read_last_update_log(UPDATE_LOG_FILE)
+    if not last or last.get("csv_mtime") != csv_mtime:
+        return False
+    if not last.get("reveals_confirmed", True):
+        # A dropped or reverted --async-send reveal must not suppress the retry.
+        return False
+    logged = last.get("prices", {})
+    if any(logged.get(name, {}).get("price_scaled") != price_to_x18(price) for name, price in prices.items()):
+        return False
+    try:
+        pushed_at = datetime.fromisoformat(last["timestamp"])
+    except (KeyError, TypeError, ValueError):
+        return False
+    age_seconds = (datetime.now(timezone.utc) - pushed_at).total_seconds()
+    return age_seconds < refresh_threshold_from_env()
 
 
 def build_updates(prices: Dict[str, float]):
@@ -118,7 +151,97 @@ def build_updates(prices: Dict[str, float]):
     return updates
 
 
+def updater_private_key() -> Optional[str]:
+    return os.getenv("ORACLE_UPDATER_PRIVATE_KEY") or os.getenv("PRIVATE_KEY")
+
+
+def new_updater() -> CuOraclePriceUpdater:
+    # Settings are read at call time so main() can load .env first.
+    return CuOraclePriceUpdater(
+        rpc_url=os.getenv("SEPOLIA_RPC_URL", DEFAULT_SEPOLIA_RPC_URL),
+        private_key=updater_private_key(),
+        oracle_address=os.getenv("CU_ORACLE_ADDRESS", DEFAULT_CU_ORACLE_ADDRESS),
+    )
+
+
+def push_updates(
+    updater: CuOraclePriceUpdater,
+    prices,
+    updates,
+    csv_mtime: Optional[float],
+    verify: bool,
+    wait_for_reveals: bool = True,
+) -> None:
+    commit_hashes, reveal_hashes = updater.commit_and_reveal(
+        updates, verify=verify, wait_for_reveals=wait_for_reveals
+    )
+    if commit_hashes or reveal_hashes:
+        log_update(prices, commit_hashes, reveal_hashes, updater, csv_mtime, reveals_confirmed=wait_for_reveals)
+
+    if reveal_hashes and not wait_for_reveals:
+        print("\nSENT: H100 index price reveals broadcast to ByteStrike CuOracle (unconfirmed)")
+    else:
+        print("\nSUCCESS: H100 index prices updated on ByteStrike CuOracle")
+    if reveal_hashes:
+        print("Reveal transactions:")
+        for tx_hash in reveal_hashes:
+            print(f"  https://sepolia.etherscan.io/tx/{tx_hash}")
+    else:
+        print("No transactions were needed; all prices already matched.")
+
+
+def report_failure(exc: Exception) -> None:
+    print("\nERROR: CUORACLE UPDATE FAILED")
+    print(f"  {exc}")
+    import traceback
+
+    traceback.print_exc()
+
+
+def run_daemon(csv_file: str, interval: float, verify: bool, wait_for_reveals: bool = True) -> None:
+    """Reuse one updater across cycles, checking every interval like the one-shot cron run would.
+
+    The CSV is only re-read when its mtime changes. The "already pushed" check runs every
+    cycle, so a refresh goes out within one interval of falling due.
+    """
+    updater = None
+    last_mtime = None
+    prices = None
+    while True:
+        try:
+            csv_mtime = os.stat(csv_file).st_mtime
+        except OSError as exc:
+            print(f"ERROR: Cannot stat {csv_file}: {exc}")
+            csv_mtime = None
+
+        if csv_mtime is not None:
+            fresh_read = csv_mtime != last_mtime or prices is None
+            if fresh_read:
+                last_mtime = csv_mtime
+                prices = read_prices_from_csv(csv_file)
+            if prices is not None:
+                try:
+                    if not force_updates_enabled() and unchanged_since_last_push(csv_mtime, prices):
+                        if fresh_read:
+                            print(f"{csv_file} is unchanged since the last logged push; nothing to do.")
+                    else:
+                        if updater is None:
+                            updater = new_updater()
+                        push_updates(updater, prices, build_updates(prices), csv_mtime, verify, wait_for_reveals)
+                except OracleRoleError:
+                    # The key cannot commit/reveal; retrying will not fix that.
+                    raise
+                except Exception as exc:
+                    # RPC outages (including while connecting) are retried next cycle.
+                    report_failure(exc)
+
+        time.sleep(interval)
+
+
 def main() -> None:
+    # python-dotenv is only imported when a .env is found (CI passes secrets as env vars).
+    load_env_file(__file__)
+
     parser = argparse.ArgumentParser(
         description="Push H100 GPU index prices to ByteStrike CuOracle",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -133,16 +256,52 @@ def main() -> None:
     )
     parser.add_argument("--no-verify", action="store_true", help="Skip read-back verification")
     parser.add_argument("--dry-run", action="store_true", help="Print planned updates without sending transactions")
+    parser.add_argument(
+        "--async-send",
+        action="store_true",
+        help="Return once reveals are broadcast instead of waiting for their receipts (implies --no-verify)",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep running and push whenever the CSV changes or a refresh is due",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=300,
+        help="Seconds between CSV checks in --daemon mode (default: 300)",
+    )
     parser.add_argument(
         "--register",
         action="store_true",
         help="Accepted for backwards compatibility; assets are already registered in CuOracle",
     )
     args = parser.parse_args()
+    # Nothing is left to verify against once we stop waiting for the reveal receipts.
+    args.no_verify = args.no_verify or args.async_send
 
     if args.register:
         print("NOTE: --register is ignored; CuOracle assets were registered during protocol deployment.")
 
+    if args.daemon:
+        if args.manual_prices or args.dry_run:
+            print("ERROR: --daemon reads prices from --csv and cannot be combined with --manual-prices or --dry-run")
+            sys.exit(1)
+        if not updater_private_key():
+            print("ERROR: Private key not configured")
+            print("Set ORACLE_UPDATER_PRIVATE_KEY or PRIVATE_KEY. The key must own CuOracle for reveal.")
+            sys.exit(1)
+        try:
+            run_daemon(args.csv, args.interval, verify=not args.no_verify, wait_for_reveals=not args.async_send)
+        except KeyboardInterrupt:
+            print("\nStopping daemon")
+        except OracleRoleError as exc:
+            report_failure(exc)
+            sys.exit(1)
+        return
+
+    csv_mtime = None
     if args.manual_prices:
         prices = {
             "H100_HOURLY": args.manual_prices[0],
@@ -153,6 +312,7 @@ def main() -> None:
         prices = read_prices_from_csv(args.csv)
         if prices is None:
             sys.exit(1)
+        csv_mtime = os.stat(args.csv).st_mtime
 
     try:
         updates = build_updates(prices)
@@ -166,36 +326,25 @@ def main() -> None:
             print(f"  {update.asset_name} -> {update.market}: {update.price_formatted}")
         sys.exit(0)
 
-    if not PRIVATE_KEY:
+    if csv_mtime is not None and not force_updates_enabled() and unchanged_since_last_push(csv_mtime, prices):
+        print(f"\n{args.csv} is unchanged since the last logged push and still within the refresh threshold.")
+        print("No transactions needed. Set ORACLE_FORCE_UPDATE=1 to push anyway.")
+        sys.exit(0)
+
+    if not updater_private_key():
         print("ERROR: Private key not configured")
         print("Set ORACLE_UPDATER_PRIVATE_KEY or PRIVATE_KEY. The key must own CuOracle for reveal.")
         sys.exit(1)
 
     try:
-        updater = CuOraclePriceUpdater(
-            rpc_url=SEPOLIA_RPC_URL,
-            private_key=PRIVATE_KEY,
-            oracle_address=CU_ORACLE_ADDRESS,
+        updater = new_updater()
+        push_updates(
+            updater, prices, updates, csv_mtime, verify=not args.no_verify, wait_for_reveals=not args.async_send
         )
-        commit_hashes, reveal_hashes = updater.commit_and_reveal(updates, verify=not args.no_verify)
-        if commit_hashes or reveal_hashes:
-            log_update(prices, commit_hashes, reveal_hashes, updater)
     except Exception as exc:
-        print("\nERROR: CUORACLE UPDATE FAILED")
-        print(f"  {exc}")
-        import traceback
-
-        traceback.print_exc()
+        report_failure(exc)
         sys.exit(1)
 
-    print("\nSUCCESS: H100 index prices updated on ByteStrike CuOracle")
-    if reveal_hashes:
-        print("Reveal transactions:")
-        for tx_hash in reveal_hashes:
-            print(f"  https://sepolia.etherscan.io/tx/{tx_hash}")
-    else:
-        print("No transactions were needed; all prices already matched.")
-
 
 if __name__ == "__main__":
     main()